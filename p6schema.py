@@ -6,16 +6,52 @@ Supports EPPM (pmSchema.xml) and PPM (ppmSchema.xml) formats.
 """
 
 import argparse
+import concurrent.futures
 import json
 import csv
+import hashlib
+import operator
+import os
+import pickle
 import re
 import sys
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field, asdict
+# Prefer lxml (libxml2 C bindings) for parsing large schema files; the
+# element API used here (get/attrib/iteration) is compatible with stdlib
+# ElementTree, which remains the fallback.
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
 
+# JSON serialization for command output: orjson (C-implemented, emits UTF-8)
+# when installed, stdlib json otherwise. Output stays pretty-printed either
+# way; only escaping of non-ASCII text differs between the two backends.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(data) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+else:
+    def _dumps(data) -> str:
+        return json.dumps(data, indent=2)
+
+# pyahocorasick enables single-pass multi-pattern search (Schema.multi_search);
+# without it each pattern scans the schema separately.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
 # Default schema directory (relative to this script)
 DEFAULT_SCHEMA_DIR = Path(__file__).parent / "schemas"
 
@@ -23,19 +59,35 @@ DEFAULT_SCHEMA_DIR = Path(__file__).parent / "schemas"
 CONFIG_FILE = Path(__file__).parent / ".p6schemarc"
 
 
+# Cached config contents, revalidated against the file's mtime so repeat
+# calls cost one stat instead of open + read + json.loads.
+_config_cache: Optional[dict] = None
+_config_mtime: int = -1
+
+
 def load_config() -> dict:
     """Load configuration from .p6schemarc file."""
-    if not CONFIG_FILE.exists():
+    global _config_cache, _config_mtime
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
         return {}
+    if _config_cache is not None and mtime == _config_mtime:
+        return _config_cache
     try:
-        return json.loads(CONFIG_FILE.read_text())
+        config = json.loads(CONFIG_FILE.read_text())
     except (json.JSONDecodeError, OSError):
         return {}
+    _config_cache = config
+    _config_mtime = mtime
+    return config
 
 
 def save_config(config: dict) -> None:
     """Save configuration to .p6schemarc file."""
+    global _config_cache
     CONFIG_FILE.write_text(json.dumps(config, indent=2) + "\n")
+    _config_cache = None
 
 
 def get_default_schema() -> Optional[str]:
@@ -44,7 +96,7 @@ def get_default_schema() -> Optional[str]:
     return config.get("default_schema")
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaEntry:
     """Registry entry for a schema file."""
     application: str  # eppm or ppm
@@ -66,8 +118,30 @@ class SchemaEntry:
 class SchemaRegistry:
     """Registry of available P6 schema files."""
 
-    # Pattern to match schema filenames: eppm_24_12_schema.xml or ppm_23_04_schema.xml
-    FILENAME_PATTERN = re.compile(r"^(eppm|ppm)_(\d{2})_(\d{2})_schema\.xml$", re.IGNORECASE)
+    # Version-only specifier, e.g. "24.12"
+    VERSION_ONLY_PATTERN = re.compile(r"\d{2}\.\d{2}")
+
+    @staticmethod
+    def _parse_filename(name: str) -> Optional[tuple[str, str]]:
+        """Parse a schema filename into (application, version), or None.
+
+        Matches eppm_YY_MM_schema.xml / ppm_YY_MM_schema.xml (any case).
+        The grammar is rigid enough that plain string checks beat the
+        regex this replaces, and _scan runs on every CLI start.
+        """
+        name = name.lower()
+        if not name.endswith("_schema.xml"):
+            return None
+        stem = name[:-11]
+        if stem.startswith("eppm_"):
+            app, rest = "eppm", stem[5:]
+        elif stem.startswith("ppm_"):
+            app, rest = "ppm", stem[4:]
+        else:
+            return None
+        if len(rest) != 5 or rest[2] != "_" or not rest[:2].isdigit() or not rest[3:].isdigit():
+            return None
+        return app, f"{rest[:2]}.{rest[3:]}"
 
     def __init__(self, schema_dir: Optional[Path] = None):
         self.schema_dir = schema_dir or DEFAULT_SCHEMA_DIR
@@ -79,19 +153,18 @@ class SchemaRegistry:
         if not self.schema_dir.exists():
             return
 
-        for path in self.schema_dir.iterdir():
-            if not path.is_file():
-                continue
-
-            match = self.FILENAME_PATTERN.match(path.name)
-            if match:
-                app = match.group(1).lower()
-                major = match.group(2)
-                minor = match.group(3)
-                version = f"{major}.{minor}"
+        # os.scandir: DirEntry caches the stat from the directory read, so
+        # this avoids a Path allocation and an is_file() stat per entry.
+        with os.scandir(self.schema_dir) as entries:
+            for dirent in entries:
+                if not dirent.is_file():
+                    continue
 
-                entry = SchemaEntry(application=app, version=version, path=path)
-                self._entries[entry.key] = entry
+                parsed = self._parse_filename(dirent.name)
+                if parsed:
+                    app, version = parsed
+                    entry = SchemaEntry(application=app, version=version, path=Path(dirent.path))
+                    self._entries[entry.key] = entry
 
     def get(self, specifier: str) -> Optional[SchemaEntry]:
         """Get schema entry by specifier (app:version)."""
@@ -99,7 +172,7 @@ class SchemaRegistry:
         specifier = specifier.lower().strip()
 
         # Handle version-only specifier (assumes eppm)
-        if ":" not in specifier and re.match(r"^\d{2}\.\d{2}$", specifier):
+        if ":" not in specifier and self.VERSION_ONLY_PATTERN.fullmatch(specifier):
             specifier = f"eppm:{specifier}"
 
         return self._entries.get(specifier)
@@ -119,11 +192,21 @@ class SchemaRegistry:
             key=lambda e: e.version
         )
 
-    @property
+    @cached_property
     def available_keys(self) -> list[str]:
-        """Return list of available schema keys."""
+        """Return list of available schema keys (entries are fixed after
+        the construction-time scan, so this is computed once)."""
         return sorted(self._entries.keys())
 
+    @cached_property
+    def known_prefixes(self) -> frozenset:
+        """Application prefixes present in the registry, e.g. {eppm, ppm}.
+
+        Lets callers reject a mistyped prefix cheaply before falling
+        back to the full not-found handling.
+        """
+        return frozenset(e.application for e in self._entries.values())
+
     def get_latest(self, application: str = "eppm") -> Optional[SchemaEntry]:
         """Get the latest version for an application."""
         entries = self.list_by_app(application)
@@ -197,7 +280,19 @@ def resolve_schema_path(specifier: Optional[str] = None) -> Path:
         )
 
 
-@dataclass
+# Shared strings for low-cardinality attributes (datatypes, Y/N flags,
+# constraint types, ...). The XML parser allocates a fresh str per
+# attribute value, so without this a schema holds tens of thousands of
+# duplicate "NUMBER"/"Y"/"N" strings. A plain dict keeps one copy of each
+# without touching the interpreter-wide intern table.
+_intern_cache: dict[str, str] = {}
+
+
+def _intern(value: str) -> str:
+    return _intern_cache.setdefault(value, value)
+
+
+@dataclass(slots=True)
 class Field:
     name: str
     datatype: str
@@ -211,20 +306,39 @@ class Field:
 
     @classmethod
     def from_xml(cls, elem: ET.Element) -> "Field":
+        # Grab the attribute dict once; elem.get is a method call per
+        # attribute, which adds up over hundreds of thousands of elements.
+        a = elem.attrib
         return cls(
-            name=elem.get("NAME", ""),
-            datatype=elem.get("DATATYPE", ""),
-            charlength=elem.get("CHARLENGTH", ""),
-            dataprecision=elem.get("DATAPRECISION", ""),
-            datascale=elem.get("DATASCALE", ""),
-            notnull=elem.get("NOTNULL", "N"),
-            default=elem.get("DEFAULT", ""),
-            description=elem.get("DESC", ""),
-            idcolumn=elem.get("IDCOLUMN", "N"),
+            name=a.get("NAME", ""),
+            datatype=_intern(a.get("DATATYPE", "")),
+            charlength=a.get("CHARLENGTH", ""),
+            dataprecision=a.get("DATAPRECISION", ""),
+            datascale=a.get("DATASCALE", ""),
+            notnull=_intern(a.get("NOTNULL", "N")),
+            default=a.get("DEFAULT", ""),
+            description=a.get("DESC", ""),
+            idcolumn=_intern(a.get("IDCOLUMN", "N")),
         )
 
+    def to_dict(self) -> dict:
+        # Hand-rolled dict view: asdict() recursively re-inspects the
+        # dataclass per call, which dominates when serializing tens of
+        # thousands of fields. Key order matches asdict output.
+        return {
+            "name": self.name,
+            "datatype": self.datatype,
+            "charlength": self.charlength,
+            "dataprecision": self.dataprecision,
+            "datascale": self.datascale,
+            "notnull": self.notnull,
+            "default": self.default,
+            "description": self.description,
+            "idcolumn": self.idcolumn,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Index:
     name: str
     fields: str
@@ -233,15 +347,24 @@ class Index:
 
     @classmethod
     def from_xml(cls, elem: ET.Element) -> "Index":
+        a = elem.attrib
         return cls(
-            name=elem.get("NAME", ""),
-            fields=elem.get("FIELD", ""),
-            uniqueness=elem.get("UNIQUENESS", "NONUNIQUE"),
-            tablespace=elem.get("TABLESPACE", ""),
+            name=a.get("NAME", ""),
+            fields=a.get("FIELD", ""),
+            uniqueness=_intern(a.get("UNIQUENESS", "NONUNIQUE")),
+            tablespace=_intern(a.get("TABLESPACE", "")),
         )
 
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "fields": self.fields,
+            "uniqueness": self.uniqueness,
+            "tablespace": self.tablespace,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     name: str
     type: str
@@ -252,17 +375,28 @@ class Constraint:
 
     @classmethod
     def from_xml(cls, elem: ET.Element) -> "Constraint":
+        a = elem.attrib
         return cls(
-            name=elem.get("NAME", ""),
-            type=elem.get("TYPE", ""),
-            fields=elem.get("FIELDS", ""),
-            target_table=elem.get("TARGETTABLE", ""),
-            target_fields=elem.get("TARGETFIELDS", ""),
-            delete_rule=elem.get("DELETERULE", ""),
+            name=a.get("NAME", ""),
+            type=_intern(a.get("TYPE", "")),
+            fields=a.get("FIELDS", ""),
+            target_table=a.get("TARGETTABLE", ""),
+            target_fields=a.get("TARGETFIELDS", ""),
+            delete_rule=_intern(a.get("DELETERULE", "")),
         )
 
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "fields": self.fields,
+            "target_table": self.target_table,
+            "target_fields": self.target_fields,
+            "delete_rule": self.delete_rule,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Trigger:
     name: str
     set_type: str
@@ -271,15 +405,24 @@ class Trigger:
 
     @classmethod
     def from_xml(cls, elem: ET.Element) -> "Trigger":
+        a = elem.attrib
         return cls(
-            name=elem.get("NAME", ""),
-            set_type=elem.get("SET", ""),
-            target=elem.get("TARGET", ""),
-            description=elem.get("DESC", ""),
+            name=a.get("NAME", ""),
+            set_type=a.get("SET", ""),
+            target=a.get("TARGET", ""),
+            description=a.get("DESC", ""),
         )
 
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "set_type": self.set_type,
+            "target": self.target,
+            "description": self.description,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     name: str
     description: str = ""
@@ -291,16 +434,58 @@ class Table:
     indexes: list = field(default_factory=list)
     constraints: list = field(default_factory=list)
     triggers: list = field(default_factory=list)
+    _constraints_by_type: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _field_names_set: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _field_names_ordered: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def field_names_set(self) -> frozenset:
+        """Frozenset of field names, built on first use (schema diffs)."""
+        names = self._field_names_set
+        if names is None:
+            names = frozenset(f.name for f in self.fields)
+            self._field_names_set = names
+        return names
+
+    @property
+    def field_names_ordered(self) -> tuple:
+        """Field names in document order, built on first use.
+
+        Diffing against another table's field_names_set with this tuple
+        yields changes in schema-definition order without a sort.
+        """
+        names = self._field_names_ordered
+        if names is None:
+            names = tuple(f.name for f in self.fields)
+            self._field_names_ordered = names
+        return names
+
+    @property
+    def constraints_by_type(self) -> dict:
+        """Constraints bucketed by TYPE ("PRIMARY", "FOREIGN", ...).
+
+        Built lazily so type-filtered scans (FK lookups, constraint
+        listings) iterate only the relevant subset instead of testing
+        c.type on every constraint.
+        """
+        buckets = self._constraints_by_type
+        if buckets is None:
+            buckets = {}
+            for c in self.constraints:
+                buckets.setdefault(c.type, []).append(c)
+            self._constraints_by_type = buckets
+        return buckets
 
     @classmethod
     def from_xml(cls, elem: ET.Element) -> "Table":
+        a = elem.attrib
         table = cls(
-            name=elem.get("NAME", ""),
-            description=elem.get("DESC", ""),
-            title=elem.get("TITLE", ""),
-            tabletype=elem.get("TABLETYPE", "NORMAL"),
-            tablespace=elem.get("TABLESPACE", ""),
-            ordinal=elem.get("ORDINAL", ""),
+            name=a.get("NAME", ""),
+            description=a.get("DESC", ""),
+            title=a.get("TITLE", ""),
+            tabletype=_intern(a.get("TABLETYPE", "NORMAL")),
+            tablespace=_intern(a.get("TABLESPACE", "")),
+            ordinal=a.get("ORDINAL", ""),
         )
         for child in elem:
             if child.tag == "FIELD":
@@ -314,13 +499,101 @@ class Table:
         return table
 
 
+class _TableStore:
+    """Lazily-parsed mapping of table name -> Table.
+
+    The parse pass stores each raw TABLE element plus a cheap field count;
+    the Table dataclass (and its fields/indexes/constraints/triggers) is
+    only built the first time a table is actually accessed. Commands that
+    touch a single table (describe, relationships) never pay for the rest.
+    Iteration preserves document order, matching the eager dict it replaces.
+    """
+
+    def __init__(self):
+        # Insertion-ordered; None marks a table not yet materialized.
+        self._tables: dict[str, Optional[Table]] = {}
+        self._elems: dict[str, ET.Element] = {}
+        self.field_counts: dict[str, int] = {}
+
+    def _add_element(self, elem: ET.Element) -> None:
+        """Register a TABLE element without parsing it."""
+        name = elem.get("NAME", "")
+        self._tables[name] = None
+        self._elems[name] = elem
+        self.field_counts[name] = sum(1 for child in elem if child.tag == "FIELD")
+
+    def _materialize(self, name: str) -> "Table":
+        elem = self._elems.pop(name)
+        table = Table.from_xml(elem)
+        elem.clear()
+        self._tables[name] = table
+        return table
+
+    def __getitem__(self, name: str) -> "Table":
+        table = self._tables[name]
+        if table is None:
+            table = self._materialize(name)
+        return table
+
+    def get(self, name: str, default=None) -> Optional["Table"]:
+        if name not in self._tables:
+            return default
+        return self[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __iter__(self):
+        return iter(self._tables)
+
+    def keys(self):
+        return self._tables.keys()
+
+    def values(self):
+        for name in self._tables:
+            yield self[name]
+
+    def items(self):
+        for name in self._tables:
+            yield name, self[name]
+
+    def __getstate__(self):
+        # Materialize every table before pickling: the pending XML
+        # elements don't pickle usefully, and a disk-cached schema should
+        # load back fully parsed.
+        for name, table in self._tables.items():
+            if table is None:
+                self._materialize(name)
+        return {"_tables": self._tables, "field_counts": self.field_counts}
+
+    def __setstate__(self, state):
+        self._tables = state["_tables"]
+        self._elems = {}
+        self.field_counts = state["field_counts"]
+
+    def summaries(self) -> list[tuple[str, str, int]]:
+        """Return (name, description, field_count) per table without
+        materializing Table objects for tables not already parsed."""
+        rows = []
+        for name, table in self._tables.items():
+            if table is not None:
+                desc = table.description
+            else:
+                desc = self._elems[name].get("DESC", "")
+            rows.append((name, desc, self.field_counts[name]))
+        return rows
+
+
 @dataclass
 class Schema:
     version: str
     dbtype: str
     build_version: str
     min_pro_version: str = ""
-    tables: dict = field(default_factory=dict)
+    tables: _TableStore = field(default_factory=_TableStore)
     source_path: str = ""
 
     @classmethod
@@ -328,67 +601,327 @@ class Schema:
         """
         Load schema from file path or registry specifier.
 
+        Parsed schemas are cached per-process, keyed on the resolved path
+        plus mtime and size, so repeated loads of the same file (several
+        commands in a session, cmd_compare on the same pair) are free.
+
         Args:
             path_or_specifier: File path or registry key (e.g., "eppm:24.12")
         """
         path = resolve_schema_path(path_or_specifier)
-        tree = ET.parse(path)
-        root = tree.getroot()
-
-        schema = cls(
-            version=root.get("VERSION", ""),
-            dbtype=root.get("DBTYPE", ""),
-            build_version=root.get("BUILD_VERSION_ID", ""),
-            min_pro_version=root.get("MIN_PRO_VERSION", ""),
-            source_path=str(path),
-        )
+        return _load_schema_cached(path)
 
-        for table_elem in root.findall("TABLE"):
-            table = Table.from_xml(table_elem)
-            schema.tables[table.name] = table
+    @classmethod
+    def _parse(cls, path: Path) -> "Schema":
+        """Parse a schema XML file (no caching)."""
+        # Stream the document instead of building the full tree up front:
+        # the root attributes are available on the first "start" event, and
+        # each TABLE element is registered with the lazy table store as its
+        # end tag is seen. Dataclass conversion is deferred until a table
+        # is actually accessed, so header-only commands stay cheap.
+        schema = None
+        for event, elem in ET.iterparse(str(path), events=("start", "end")):
+            if event == "start":
+                if schema is None:
+                    schema = cls(
+                        version=elem.get("VERSION", ""),
+                        dbtype=elem.get("DBTYPE", ""),
+                        build_version=elem.get("BUILD_VERSION_ID", ""),
+                        min_pro_version=elem.get("MIN_PRO_VERSION", ""),
+                        source_path=str(path),
+                    )
+            elif elem.tag == "TABLE":
+                schema.tables._add_element(elem)
 
         return schema
 
+    def __getstate__(self):
+        # Keep pickles to the declared fields: the cached_property values
+        # living in __dict__ are derived indexes that rebuild on demand.
+        return {
+            "version": self.version,
+            "dbtype": self.dbtype,
+            "build_version": self.build_version,
+            "min_pro_version": self.min_pro_version,
+            "tables": self.tables,
+            "source_path": self.source_path,
+        }
+
     def get_table(self, name: str) -> Optional[Table]:
         return self.tables.get(name.upper())
 
+    @cached_property
+    def _table_list(self) -> list:
+        """All tables as a list in document order (materializes the store)."""
+        return list(self.tables.values())
+
+    @cached_property
+    def tables_sorted(self) -> list:
+        """All tables sorted by name, computed once per Schema.
+
+        attrgetter keeps the sort key in C; listing commands and tools
+        that present tables alphabetically share this view.
+        """
+        return sorted(self.tables.values(), key=operator.attrgetter("name"))
+
+    # Struct-of-arrays views: the per-table child lists laid out as
+    # parallel arrays, so bulk aggregations can run through C-level
+    # map/len instead of per-table attribute access in Python.
+    @cached_property
+    def _field_lists(self) -> list:
+        return [t.fields for t in self._table_list]
+
+    @cached_property
+    def _index_lists(self) -> list:
+        return [t.indexes for t in self._table_list]
+
+    @cached_property
+    def _constraint_lists(self) -> list:
+        return [t.constraints for t in self._table_list]
+
+    @cached_property
+    def stats(self) -> dict:
+        """Aggregate schema statistics, computed once per Schema.
+
+        Cached so repeated stats queries (CLI re-runs against the parse
+        cache, MCP tool calls) reduce to returning this dict.
+        """
+        # Counter.update takes the C-implemented counting path, so the
+        # histogram costs one generator pass per table.
+        datatypes = Counter()
+        for fields in self._field_lists:
+            datatypes.update(f.datatype for f in fields)
+        return {
+            "version": self.version,
+            "tables": len(self.tables),
+            "fields": sum(map(len, self._field_lists)),
+            "indexes": sum(map(len, self._index_lists)),
+            "constraints": sum(map(len, self._constraint_lists)),
+            "foreign_keys": sum(
+                len(t.constraints_by_type.get("FOREIGN", ())) for t in self._table_list
+            ),
+            # Plain dict: both JSON serializers handle it without
+            # special-casing the Counter subclass.
+            "datatypes": dict(datatypes),
+        }
+
+    @cached_property
+    def _table_name_index(self) -> list:
+        """(uppercased name, name) per table, for search_tables."""
+        return [(name.upper(), name) for name in self.tables.keys()]
+
+    @cached_property
+    def _table_name_blob(self) -> str:
+        """All uppercased table names joined into one string.
+
+        One `pattern in blob` test rejects a miss in a single C-level
+        scan, skipping the per-table loop entirely. \\x01 separates the
+        names so a pattern cannot match across a boundary.
+        """
+        return "\x01".join(upper for upper, _ in self._table_name_index)
+
+    @cached_property
+    def _field_index(self) -> list:
+        """Flat (table_name, uppercased field name, Field) triples.
+
+        Built once so repeated field searches are a single C-level
+        substring test per field instead of re-uppercasing every name.
+        """
+        return [
+            (table.name, f.name.upper(), f)
+            for table in self.tables.values()
+            for f in table.fields
+        ]
+
+    @cached_property
+    def _field_name_blob(self) -> str:
+        """All uppercased field names joined, for the search early-out."""
+        return "\x01".join(upper for _, upper, _ in self._field_index)
+
     def search_tables(self, pattern: str) -> list:
         pattern = pattern.upper()
-        return [t for name, t in self.tables.items() if pattern in name]
+        if pattern not in self._table_name_blob:
+            return []
+        # Match on names first so only hit tables are materialized.
+        return [self.tables[name] for upper, name in self._table_name_index if pattern in upper]
 
     def search_fields(self, pattern: str) -> list:
         pattern = pattern.upper()
-        results = []
+        if pattern not in self._field_name_blob:
+            return []
+        return [(table_name, f) for table_name, upper, f in self._field_index if pattern in upper]
+
+    @cached_property
+    def constraints_by_type(self) -> dict:
+        """(table_name, Constraint) pairs bucketed by constraint type.
+
+        Built once per Schema so type-filtered constraint listings walk
+        only their bucket instead of every constraint in the schema.
+        Within a bucket, pairs keep document order.
+        """
+        buckets: dict[str, list[tuple[str, Constraint]]] = {}
         for table in self.tables.values():
-            for f in table.fields:
-                if pattern in f.name.upper():
-                    results.append((table.name, f))
-        return results
+            for c in table.constraints:
+                buckets.setdefault(c.type, []).append((table.name, c))
+        return buckets
+
+    @cached_property
+    def _incoming_fks(self) -> dict:
+        """Reverse FK index: uppercased target table -> [(source_table, Constraint)].
+
+        Built once per Schema so incoming-relationship lookups are a dict
+        access instead of a scan over every table's constraints.
+        """
+        index: dict[str, list[tuple[str, Constraint]]] = {}
+        for table in self.tables.values():
+            for c in table.constraints_by_type.get("FOREIGN", ()):
+                index.setdefault(c.target_table.upper(), []).append((table.name, c))
+        return index
+
+    @cached_property
+    def _fk_search_index(self) -> list:
+        """Per-FK (search_blob, result_dict) pairs for search_relationships.
+
+        The blob joins the uppercased source table, target table, fields,
+        and constraint name, so matching is one substring test per FK.
+        """
+        index = []
+        for table in self.tables.values():
+            for c in table.constraints_by_type.get("FOREIGN", ()):
+                blob = "\x01".join((
+                    table.name.upper(),
+                    c.target_table.upper(),
+                    c.fields.upper(),
+                    c.target_fields.upper(),
+                    c.name.upper(),
+                ))
+                index.append((blob, {
+                    "source_table": table.name,
+                    "constraint": c.name,
+                    "fields": c.fields,
+                    "target_table": c.target_table,
+                    "target_fields": c.target_fields,
+                }))
+        return index
 
     def search_relationships(self, pattern: str) -> list:
         """Search foreign key relationships by table name, field, or constraint name."""
         pattern = pattern.upper()
-        results = []
-        for table in self.tables.values():
-            for c in table.constraints:
-                if c.type != "FOREIGN":
-                    continue
-                # Match against source table, target table, fields, or constraint name
-                if (pattern in table.name.upper() or
-                    pattern in c.target_table.upper() or
-                    pattern in c.fields.upper() or
-                    pattern in c.target_fields.upper() or
-                    pattern in c.name.upper()):
-                    results.append({
-                        "source_table": table.name,
-                        "constraint": c.name,
-                        "fields": c.fields,
-                        "target_table": c.target_table,
-                        "target_fields": c.target_fields,
-                    })
+        return [rel for blob, rel in self._fk_search_index if pattern in blob]
+
+    def multi_search(self, patterns: list) -> dict:
+        """Run several search patterns over the schema at once.
+
+        Returns {pattern: (tables, fields, relationships)} with the same
+        entries the single-pattern search methods produce. With
+        pyahocorasick installed, all patterns are matched in one linear
+        pass over the cached search indexes; otherwise each pattern is
+        searched separately.
+        """
+        if ahocorasick is None:
+            return {
+                p: (self.search_tables(p), self.search_fields(p), self.search_relationships(p))
+                for p in patterns
+            }
+
+        # Several input patterns may normalize to the same uppercase key.
+        by_upper: dict[str, list[str]] = {}
+        for p in patterns:
+            by_upper.setdefault(p.upper(), []).append(p)
+
+        automaton = ahocorasick.Automaton()
+        for upper in by_upper:
+            automaton.add_word(upper, upper)
+        automaton.make_automaton()
+        results: dict[str, tuple[list, list, list]] = {p: ([], [], []) for p in patterns}
+
+        def matched(haystack):
+            return {found for _, found in automaton.iter(haystack)}
+
+        for upper, name in self._table_name_index:
+            for key in matched(upper):
+                for p in by_upper[key]:
+                    results[p][0].append(self.tables[name])
+        for table_name, upper, f in self._field_index:
+            for key in matched(upper):
+                for p in by_upper[key]:
+                    results[p][1].append((table_name, f))
+        for blob, rel in self._fk_search_index:
+            for key in matched(blob):
+                for p in by_upper[key]:
+                    results[p][2].append(rel)
         return results
 
 
+# Process-level cache of parsed schemas. Keyed on resolved path + mtime +
+# size so an edited file is re-parsed automatically; bounded LRU so a long
+# session scripting over many schemas cannot grow without limit.
+_SCHEMA_CACHE_MAX = 8
+_schema_cache: "OrderedDict[tuple[str, int, int], Schema]" = OrderedDict()
+
+
+def _disk_cache_path(path: Path) -> Path:
+    """Cache file for a schema path, under XDG_CACHE_HOME or ~/.cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    digest = hashlib.sha1(str(path).encode()).hexdigest()
+    return base / "p6schema" / f"{digest}.pkl"
+
+
+def _read_schema_pickle(cache_path: Path, key: tuple) -> Optional[Schema]:
+    """Load a pickled Schema if the cache entry matches key, else None."""
+    try:
+        with open(cache_path, "rb") as f:
+            stored_key, schema = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, IndexError):
+        return None
+    if stored_key != key:
+        return None
+    return schema
+
+
+def _write_schema_pickle(cache_path: Path, key: tuple, schema: Schema) -> None:
+    """Best-effort pickle of a parsed Schema; failures are ignored.
+
+    Written to a temp file then renamed, so concurrent CLI invocations
+    never see a partial cache entry.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((key, schema), f, protocol=5)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+
+
+def _load_schema_cached(path: Path) -> Schema:
+    """Load a schema through the process and disk caches.
+
+    Lookup order: the process-level LRU, then a pickle under the user
+    cache directory, then a full XML parse (which refreshes the pickle).
+    All cache entries are keyed on (path, mtime_ns, size), so an edited
+    schema file invalidates both layers automatically.
+    """
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    schema = _schema_cache.get(key)
+    if schema is None:
+        cache_path = _disk_cache_path(path)
+        schema = _read_schema_pickle(cache_path, key)
+        if schema is None:
+            schema = Schema._parse(path)
+            _write_schema_pickle(cache_path, key, schema)
+        _schema_cache[key] = schema
+        if len(_schema_cache) > _SCHEMA_CACHE_MAX:
+            _schema_cache.popitem(last=False)
+    else:
+        _schema_cache.move_to_end(key)
+    return schema
+
+
 def cmd_list(args):
     """List available schemas in the registry."""
     registry = get_registry()
@@ -411,7 +944,7 @@ def cmd_list(args):
             }
             for e in entries
         ]
-        print(json.dumps(data, indent=2))
+        print(_dumps(data))
     else:
         print(f"Available Schemas ({len(entries)}):")
         print(f"  {'Key':<15} {'Application':<10} {'Version':<10} Path")
@@ -441,22 +974,27 @@ def cmd_info(args):
 def cmd_tables(args):
     """List all tables."""
     schema = Schema.from_xml(args.schema)
-    tables = sorted(schema.tables.values(), key=lambda t: t.name)
+    # Name/description/field-count come from the lazy store's summary rows,
+    # so listing never materializes the per-table dataclasses.
+    rows = sorted(schema.tables.summaries())
 
     if args.format == "json":
-        data = [{"name": t.name, "description": t.description, "fields": len(t.fields)} for t in tables]
-        print(json.dumps(data, indent=2))
+        data = [{"name": name, "description": desc, "fields": count} for name, desc, count in rows]
+        print(_dumps(data))
     elif args.format == "csv":
+        # Write rows straight to stdout: the stream's own block buffer
+        # batches syscalls, and output starts before the last row exists.
         writer = csv.writer(sys.stdout)
         writer.writerow(["name", "description", "field_count"])
-        for t in tables:
-            writer.writerow([t.name, t.description, len(t.fields)])
+        for name, desc, count in rows:
+            writer.writerow([name, desc, count])
     else:
-        print(f"{'Table Name':<40} {'Fields':>6}  Description")
-        print("-" * 80)
-        for t in tables:
-            desc = t.description[:30] + "..." if len(t.description) > 30 else t.description
-            print(f"{t.name:<40} {len(t.fields):>6}  {desc}")
+        lines = [f"{'Table Name':<40} {'Fields':>6}  Description", "-" * 80]
+        for name, desc, count in rows:
+            desc = desc[:30] + "..." if len(desc) > 30 else desc
+            lines.append(f"{name:<40} {count:>6}  {desc}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 def cmd_describe(args):
@@ -474,44 +1012,47 @@ def cmd_describe(args):
             "description": table.description,
             "title": table.title,
             "tablespace": table.tablespace,
-            "fields": [asdict(f) for f in table.fields],
-            "indexes": [asdict(i) for i in table.indexes],
-            "constraints": [asdict(c) for c in table.constraints],
-            "triggers": [asdict(t) for t in table.triggers],
+            "fields": [f.to_dict() for f in table.fields],
+            "indexes": [i.to_dict() for i in table.indexes],
+            "constraints": [c.to_dict() for c in table.constraints],
+            "triggers": [t.to_dict() for t in table.triggers],
         }
-        print(json.dumps(data, indent=2))
+        print(_dumps(data))
         return
 
-    print(f"\nTable: {table.name}")
+    lines = [f"\nTable: {table.name}"]
     if table.title:
-        print(f"Title: {table.title}")
+        lines.append(f"Title: {table.title}")
     if table.description:
-        print(f"Description: {table.description}")
-    print(f"Tablespace: {table.tablespace}")
+        lines.append(f"Description: {table.description}")
+    lines.append(f"Tablespace: {table.tablespace}")
 
-    print(f"\nFields ({len(table.fields)}):")
-    print(f"  {'Name':<35} {'Type':<12} {'Length':<8} {'Null':<5} Description")
-    print("  " + "-" * 90)
+    lines.append(f"\nFields ({len(table.fields)}):")
+    lines.append(f"  {'Name':<35} {'Type':<12} {'Length':<8} {'Null':<5} Description")
+    lines.append("  " + "-" * 90)
     for f in table.fields:
         length = f.charlength or f.dataprecision or ""
         nullable = "NULL" if f.notnull != "Y" else "NOT NULL"
         desc = f.description[:35] + "..." if len(f.description) > 35 else f.description
-        print(f"  {f.name:<35} {f.datatype:<12} {length:<8} {nullable:<8} {desc}")
+        lines.append(f"  {f.name:<35} {f.datatype:<12} {length:<8} {nullable:<8} {desc}")
 
     if table.indexes:
-        print(f"\nIndexes ({len(table.indexes)}):")
+        lines.append(f"\nIndexes ({len(table.indexes)}):")
         for i in table.indexes:
-            print(f"  {i.name}: {i.fields} ({i.uniqueness})")
+            lines.append(f"  {i.name}: {i.fields} ({i.uniqueness})")
 
     if table.constraints:
-        print(f"\nConstraints ({len(table.constraints)}):")
+        lines.append(f"\nConstraints ({len(table.constraints)}):")
         for c in table.constraints:
             if c.type == "PRIMARY":
-                print(f"  PK: {c.name} ({c.fields})")
+                lines.append(f"  PK: {c.name} ({c.fields})")
             elif c.type == "FOREIGN":
-                print(f"  FK: {c.name} ({c.fields}) -> {c.target_table}({c.target_fields})")
+                lines.append(f"  FK: {c.name} ({c.fields}) -> {c.target_table}({c.target_fields})")
             else:
-                print(f"  {c.type}: {c.name} ({c.fields})")
+                lines.append(f"  {c.type}: {c.name} ({c.fields})")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
 def cmd_relationships(args):
@@ -525,28 +1066,25 @@ def cmd_relationships(args):
 
     # Outgoing: tables this table references
     outgoing = []
-    for c in table.constraints:
-        if c.type == "FOREIGN":
-            outgoing.append({
-                "constraint": c.name,
-                "fields": c.fields,
-                "references_table": c.target_table,
-                "references_fields": c.target_fields,
-            })
-
-    # Incoming: tables that reference this table
+    for c in table.constraints_by_type.get("FOREIGN", ()):
+        outgoing.append({
+            "constraint": c.name,
+            "fields": c.fields,
+            "references_table": c.target_table,
+            "references_fields": c.target_fields,
+        })
+
+    # Incoming: tables that reference this table (via the reverse FK index)
     incoming = []
-    for other_table in schema.tables.values():
-        if other_table.name == table.name:
+    for source_name, c in schema._incoming_fks.get(table.name.upper(), []):
+        if source_name == table.name:
             continue
-        for c in other_table.constraints:
-            if c.type == "FOREIGN" and c.target_table.upper() == table.name.upper():
-                incoming.append({
-                    "table": other_table.name,
-                    "constraint": c.name,
-                    "fields": c.fields,
-                    "references_fields": c.target_fields,
-                })
+        incoming.append({
+            "table": source_name,
+            "constraint": c.name,
+            "fields": c.fields,
+            "references_fields": c.target_fields,
+        })
 
     if args.format == "json":
         data = {
@@ -554,7 +1092,7 @@ def cmd_relationships(args):
             "outgoing": outgoing,
             "incoming": incoming,
         }
-        print(json.dumps(data, indent=2))
+        print(_dumps(data))
         return
 
     print(f"\nRelationships for: {table.name}")
@@ -619,7 +1157,7 @@ def cmd_search(args):
             data = [{"table": table, "field": f.name, "type": f.datatype, "description": f.description} for table, f in field_results]
         else:  # rel/relationship
             data = rel_results
-        print(json.dumps(data, indent=2))
+        print(_dumps(data))
         return
 
     # Text output
@@ -661,8 +1199,13 @@ def cmd_search(args):
 
 def cmd_compare(args):
     """Compare two schemas."""
-    schema1 = Schema.from_xml(args.schema1)
-    schema2 = Schema.from_xml(args.schema2)
+    # The two parses are independent and parser-bound, so overlap them;
+    # libxml2/expat do the heavy lifting in C and release the GIL.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(Schema.from_xml, args.schema1)
+        future2 = executor.submit(Schema.from_xml, args.schema2)
+        schema1 = future1.result()
+        schema2 = future2.result()
 
     tables1 = set(schema1.tables.keys())
     tables2 = set(schema2.tables.keys())
@@ -671,26 +1214,34 @@ def cmd_compare(args):
     removed = tables1 - tables2
     common = tables1 & tables2
 
+    # Field diffs are computed once and shared by both output formats.
+    # Scanning the ordered name tuples against the other table's cached
+    # name set lists changes in schema-definition order, no sort needed.
+    modified = []
+    for name in common:
+        t1 = schema1.tables[name]
+        t2 = schema2.tables[name]
+        f1 = t1.field_names_set
+        f2 = t2.field_names_set
+        if f1 != f2:
+            modified.append((
+                name,
+                [n for n in t2.field_names_ordered if n not in f1],
+                [n for n in t1.field_names_ordered if n not in f2],
+            ))
+
     if args.format == "json":
         data = {
             "schema1": {"version": schema1.version, "tables": len(tables1)},
             "schema2": {"version": schema2.version, "tables": len(tables2)},
             "added_tables": sorted(added),
             "removed_tables": sorted(removed),
-            "modified_tables": [],
+            "modified_tables": [
+                {"table": name, "added_fields": added_fields, "removed_fields": removed_fields}
+                for name, added_fields, removed_fields in modified
+            ],
         }
-        for name in common:
-            t1 = schema1.tables[name]
-            t2 = schema2.tables[name]
-            f1 = {f.name for f in t1.fields}
-            f2 = {f.name for f in t2.fields}
-            if f1 != f2:
-                data["modified_tables"].append({
-                    "table": name,
-                    "added_fields": sorted(f2 - f1),
-                    "removed_fields": sorted(f1 - f2),
-                })
-        print(json.dumps(data, indent=2))
+        print(_dumps(data))
         return
 
     print(f"Schema Comparison")
@@ -710,55 +1261,73 @@ def cmd_compare(args):
             print(f"  - {name}")
         print()
 
-    modified = []
-    for name in common:
-        t1 = schema1.tables[name]
-        t2 = schema2.tables[name]
-        f1 = {f.name for f in t1.fields}
-        f2 = {f.name for f in t2.fields}
-        if f1 != f2:
-            modified.append((name, f2 - f1, f1 - f2))
-
     if modified:
         print(f"Tables with field changes ({len(modified)}):")
         for name, added_fields, removed_fields in modified:
             print(f"  {name}:")
-            for f in sorted(added_fields):
+            for f in added_fields:
                 print(f"    + {f}")
-            for f in sorted(removed_fields):
+            for f in removed_fields:
                 print(f"    - {f}")
 
 
-def cmd_export(args):
-    """Export schema to JSON."""
-    schema = Schema.from_xml(args.schema)
+if orjson is not None:
+    def _dumps_bytes(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    def _dumps_bytes(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 
-    data = {
+def _write_export(schema: Schema, out) -> None:
+    """Stream a schema export as indent=2 JSON to a binary file object.
+
+    Tables are serialized one at a time so peak memory stays at one
+    table's JSON instead of the whole document plus its string form.
+    Writing UTF-8 bytes directly skips the str intermediate entirely
+    when orjson provides the chunks.
+    """
+    out.write(b"{\n")
+    header = {
         "version": schema.version,
         "dbtype": schema.dbtype,
         "build_version": schema.build_version,
         "min_pro_version": schema.min_pro_version,
         "table_count": len(schema.tables),
-        "tables": {},
     }
+    for key, value in header.items():
+        out.write(f"  {json.dumps(key)}: {json.dumps(value)},\n".encode())
+    out.write(b'  "tables": {\n')
 
+    first = True
     for name, table in schema.tables.items():
-        data["tables"][name] = {
+        chunk = _dumps_bytes({
             "name": table.name,
             "description": table.description,
             "title": table.title,
             "tablespace": table.tablespace,
-            "fields": [asdict(f) for f in table.fields],
-            "indexes": [asdict(i) for i in table.indexes],
-            "constraints": [asdict(c) for c in table.constraints],
-        }
+            "fields": [f.to_dict() for f in table.fields],
+            "indexes": [i.to_dict() for i in table.indexes],
+            "constraints": [c.to_dict() for c in table.constraints],
+        })
+        if not first:
+            out.write(b",\n")
+        first = False
+        out.write(f"    {json.dumps(name)}: ".encode())
+        out.write(chunk.replace(b"\n", b"\n    "))
+    out.write(b"\n  }\n}\n")
+
+
+def cmd_export(args):
+    """Export schema to JSON."""
+    schema = Schema.from_xml(args.schema)
 
-    output = json.dumps(data, indent=2)
     if args.output:
-        Path(args.output).write_text(output)
+        with open(args.output, "wb") as out:
+            _write_export(schema, out)
         print(f"Exported to {args.output}")
     else:
-        print(output)
+        _write_export(schema, sys.stdout.buffer)
 
 
 def cmd_fields(args):
@@ -772,7 +1341,7 @@ def cmd_fields(args):
             sys.exit(1)
         tables = [table]
     else:
-        tables = sorted(schema.tables.values(), key=lambda t: t.name)
+        tables = schema.tables_sorted
 
     if args.format == "json":
         data = []
@@ -786,7 +1355,7 @@ def cmd_fields(args):
                     "notnull": f.notnull == "Y",
                     "description": f.description,
                 })
-        print(json.dumps(data, indent=2))
+        print(_dumps(data))
     elif args.format == "csv":
         writer = csv.writer(sys.stdout)
         writer.writerow(["table", "field", "datatype", "length", "notnull", "description"])
@@ -794,12 +1363,13 @@ def cmd_fields(args):
             for f in t.fields:
                 writer.writerow([t.name, f.name, f.datatype, f.charlength, f.notnull, f.description])
     else:
-        print(f"{'Table':<30} {'Field':<35} {'Type':<12} {'Length':<8}")
-        print("-" * 90)
+        lines = [f"{'Table':<30} {'Field':<35} {'Type':<12} {'Length':<8}", "-" * 90]
         for t in tables:
             for f in t.fields:
                 length = f.charlength or f.dataprecision or ""
-                print(f"{t.name:<30} {f.name:<35} {f.datatype:<12} {length:<8}")
+                lines.append(f"{t.name:<30} {f.name:<35} {f.datatype:<12} {length:<8}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 def cmd_constraints(args):
@@ -807,63 +1377,45 @@ def cmd_constraints(args):
     schema = Schema.from_xml(args.schema)
 
     if args.type == "fk":
-        constraint_type = "FOREIGN"
+        results = schema.constraints_by_type.get("FOREIGN", [])
     elif args.type == "pk":
-        constraint_type = "PRIMARY"
+        results = schema.constraints_by_type.get("PRIMARY", [])
     else:
-        constraint_type = None
-
-    results = []
-    for table in schema.tables.values():
-        for c in table.constraints:
-            if constraint_type is None or c.type == constraint_type:
-                results.append((table.name, c))
+        # "all" keeps the per-table interleaving of the document.
+        results = [
+            (table.name, c)
+            for table in schema.tables.values()
+            for c in table.constraints
+        ]
 
     if args.format == "json":
         data = [{"table": t, "name": c.name, "type": c.type, "fields": c.fields, "target_table": c.target_table, "target_fields": c.target_fields} for t, c in results]
-        print(json.dumps(data, indent=2))
+        print(_dumps(data))
     else:
-        print(f"{'Table':<30} {'Type':<8} {'Fields':<30} {'References':<40}")
-        print("-" * 110)
+        lines = [f"{'Table':<30} {'Type':<8} {'Fields':<30} {'References':<40}", "-" * 110]
         for table, c in results:
             ref = f"{c.target_table}({c.target_fields})" if c.target_table else ""
-            print(f"{table:<30} {c.type:<8} {c.fields:<30} {ref:<40}")
+            lines.append(f"{table:<30} {c.type:<8} {c.fields:<30} {ref:<40}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 def cmd_stats(args):
     """Show schema statistics."""
     schema = Schema.from_xml(args.schema)
-
-    total_fields = sum(len(t.fields) for t in schema.tables.values())
-    total_indexes = sum(len(t.indexes) for t in schema.tables.values())
-    total_constraints = sum(len(t.constraints) for t in schema.tables.values())
-    total_fks = sum(1 for t in schema.tables.values() for c in t.constraints if c.type == "FOREIGN")
-
-    datatypes = {}
-    for t in schema.tables.values():
-        for f in t.fields:
-            datatypes[f.datatype] = datatypes.get(f.datatype, 0) + 1
+    stats = schema.stats
 
     if args.format == "json":
-        data = {
-            "version": schema.version,
-            "tables": len(schema.tables),
-            "fields": total_fields,
-            "indexes": total_indexes,
-            "constraints": total_constraints,
-            "foreign_keys": total_fks,
-            "datatypes": datatypes,
-        }
-        print(json.dumps(data, indent=2))
+        print(_dumps(stats))
     else:
-        print(f"Schema Statistics: {schema.version}")
-        print(f"  Tables:       {len(schema.tables)}")
-        print(f"  Fields:       {total_fields}")
-        print(f"  Indexes:      {total_indexes}")
-        print(f"  Constraints:  {total_constraints}")
-        print(f"  Foreign Keys: {total_fks}")
+        print(f"Schema Statistics: {stats['version']}")
+        print(f"  Tables:       {stats['tables']}")
+        print(f"  Fields:       {stats['fields']}")
+        print(f"  Indexes:      {stats['indexes']}")
+        print(f"  Constraints:  {stats['constraints']}")
+        print(f"  Foreign Keys: {stats['foreign_keys']}")
         print(f"\nField Data Types:")
-        for dtype, count in sorted(datatypes.items(), key=lambda x: -x[1]):
+        for dtype, count in sorted(stats["datatypes"].items(), key=lambda x: -x[1]):
             print(f"  {dtype:<15} {count:>6}")
 
 
@@ -882,7 +1434,7 @@ def cmd_config(args):
         if "default_schema" in config:
             print(f"  Default schema: {config['default_schema']}")
         if args.format == "json":
-            print(json.dumps(config, indent=2))
+            print(_dumps(config))
 
     elif args.action == "set-default":
         schema_spec = args.schema
@@ -896,6 +1448,15 @@ def cmd_config(args):
                 save_config(config)
                 print(f"Default schema set to: {schema_spec}")
                 return
+            prefix = schema_spec.split(":", 1)[0].lower() if ":" in schema_spec else None
+            if prefix is not None and prefix not in registry.known_prefixes:
+                known = ", ".join(sorted(registry.known_prefixes))
+                print(
+                    f"Error: Unknown application prefix '{prefix}'. "
+                    f"Known prefixes: {known}",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
             available = registry.available_keys
             print(f"Error: Schema '{schema_spec}' not found.", file=sys.stderr)
             if available:
@@ -920,106 +1481,180 @@ def cmd_config(args):
 
 SCHEMA_HELP = "Schema: file path or registry key (default: latest EPPM)"
 
+# Shared argparse choices, defined once instead of a fresh list literal
+# per subparser.
+_FMT_TEXT_JSON = ("text", "json")
+_FMT_TEXT_JSON_CSV = ("text", "json", "csv")
+_CONSTRAINT_TYPES = ("all", "pk", "fk")
+_SEARCH_TYPES = ("table", "field", "rel", "relationship", "all")
+_CONFIG_ACTIONS = ("show", "set-default", "clear")
 
-def main():
-    parser = argparse.ArgumentParser(
-        prog="p6schema",
-        description="Parse and analyze Oracle P6 EPPM schema files. "
-        "Use 'p6schema list' to see available schemas. "
-        "If no schema is specified, the latest EPPM version is used.",
-        epilog="Schema can be specified as a file path or registry key (e.g., eppm:24.12)",
-    )
-    parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
+# True when this invocation will actually display help (-h/--help, or no
+# command at all). Set once in main() before any parser is built.
+_HELP_WANTED = False
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
+def _h(text: str) -> Optional[str]:
+    """Return help text only when it will be shown.
+
+    argparse formats help/description strings even on runs that never
+    display them; passing None instead skips that work on the fast path.
+    """
+    return text if _HELP_WANTED else None
+
+
+# Subcommand builders. Each registers exactly one subparser, so main() can
+# construct only the command actually named on the command line and skip
+# the other eleven; help/unknown/no-command paths still build them all.
+
+def _add_list_parser(subparsers):
     # list command - show available schemas
-    p = subparsers.add_parser("list", help="List available schemas in registry")
-    p.add_argument("-f", "--format", choices=["text", "json"], default="text")
+    p = subparsers.add_parser("list", help=_h("List available schemas in registry"))
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON, default="text")
     p.set_defaults(func=cmd_list)
 
-    # info command
-    p = subparsers.add_parser("info", help="Show schema information")
-    p.add_argument("schema", nargs="?", default=None, help=SCHEMA_HELP)
+
+def _add_info_parser(subparsers):
+    p = subparsers.add_parser("info", help=_h("Show schema information"))
+    p.add_argument("schema", nargs="?", default=None, help=_h(SCHEMA_HELP))
     p.set_defaults(func=cmd_info)
 
-    # tables command
-    p = subparsers.add_parser("tables", help="List all tables")
-    p.add_argument("schema", nargs="?", default=None, help=SCHEMA_HELP)
-    p.add_argument("-f", "--format", choices=["text", "json", "csv"], default="text")
+
+def _add_tables_parser(subparsers):
+    p = subparsers.add_parser("tables", help=_h("List all tables"))
+    p.add_argument("schema", nargs="?", default=None, help=_h(SCHEMA_HELP))
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON_CSV, default="text")
     p.set_defaults(func=cmd_tables)
 
-    # describe command
-    p = subparsers.add_parser("describe", help="Describe a table")
-    p.add_argument("table", help="Table name")
-    p.add_argument("-s", "--schema", default=None, help=SCHEMA_HELP)
-    p.add_argument("-f", "--format", choices=["text", "json"], default="text")
+
+def _add_describe_parser(subparsers):
+    p = subparsers.add_parser("describe", help=_h("Describe a table"))
+    p.add_argument("table", help=_h("Table name"))
+    p.add_argument("-s", "--schema", default=None, help=_h(SCHEMA_HELP))
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON, default="text")
     p.set_defaults(func=cmd_describe)
 
-    # relationships command
-    p = subparsers.add_parser("relationships", aliases=["rels"], help="Show table relationships")
-    p.add_argument("table", help="Table name")
-    p.add_argument("-s", "--schema", default=None, help=SCHEMA_HELP)
-    p.add_argument("-f", "--format", choices=["text", "json"], default="text")
+
+def _add_relationships_parser(subparsers):
+    p = subparsers.add_parser("relationships", aliases=["rels"], help=_h("Show table relationships"))
+    p.add_argument("table", help=_h("Table name"))
+    p.add_argument("-s", "--schema", default=None, help=_h(SCHEMA_HELP))
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON, default="text")
     p.set_defaults(func=cmd_relationships)
 
-    # search command
-    p = subparsers.add_parser("search", help="Search tables, fields, relationships, or all")
-    p.add_argument("pattern", help="Search pattern")
-    p.add_argument("-s", "--schema", default=None, help=SCHEMA_HELP)
+
+def _add_search_parser(subparsers):
+    p = subparsers.add_parser("search", help=_h("Search tables, fields, relationships, or all"))
+    p.add_argument("pattern", help=_h("Search pattern"))
+    p.add_argument("-s", "--schema", default=None, help=_h(SCHEMA_HELP))
     p.add_argument(
         "-t", "--type",
-        choices=["table", "field", "rel", "relationship", "all"],
+        choices=_SEARCH_TYPES,
         default="all",
-        help="What to search: table, field, rel[ationship], or all (default: all)"
+        help=_h("What to search: table, field, rel[ationship], or all (default: all)")
     )
-    p.add_argument("-f", "--format", choices=["text", "json"], default="text")
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON, default="text")
     p.set_defaults(func=cmd_search)
 
-    # compare command
-    p = subparsers.add_parser("compare", help="Compare two schemas")
-    p.add_argument("schema1", help=SCHEMA_HELP)
-    p.add_argument("schema2", help=SCHEMA_HELP)
-    p.add_argument("-f", "--format", choices=["text", "json"], default="text")
+
+def _add_compare_parser(subparsers):
+    p = subparsers.add_parser("compare", help=_h("Compare two schemas"))
+    p.add_argument("schema1", help=_h(SCHEMA_HELP))
+    p.add_argument("schema2", help=_h(SCHEMA_HELP))
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON, default="text")
     p.set_defaults(func=cmd_compare)
 
-    # export command
-    p = subparsers.add_parser("export", help="Export schema to JSON")
-    p.add_argument("schema", nargs="?", default=None, help=SCHEMA_HELP)
-    p.add_argument("-o", "--output", help="Output file (stdout if not specified)")
+
+def _add_export_parser(subparsers):
+    p = subparsers.add_parser("export", help=_h("Export schema to JSON"))
+    p.add_argument("schema", nargs="?", default=None, help=_h(SCHEMA_HELP))
+    p.add_argument("-o", "--output", help=_h("Output file (stdout if not specified)"))
     p.set_defaults(func=cmd_export)
 
-    # fields command
-    p = subparsers.add_parser("fields", help="List fields")
-    p.add_argument("schema", nargs="?", default=None, help=SCHEMA_HELP)
-    p.add_argument("-t", "--table", help="Filter by table name")
-    p.add_argument("-f", "--format", choices=["text", "json", "csv"], default="text")
+
+def _add_fields_parser(subparsers):
+    p = subparsers.add_parser("fields", help=_h("List fields"))
+    p.add_argument("schema", nargs="?", default=None, help=_h(SCHEMA_HELP))
+    p.add_argument("-t", "--table", help=_h("Filter by table name"))
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON_CSV, default="text")
     p.set_defaults(func=cmd_fields)
 
-    # constraints command
-    p = subparsers.add_parser("constraints", help="List constraints")
-    p.add_argument("schema", nargs="?", default=None, help=SCHEMA_HELP)
-    p.add_argument("-t", "--type", choices=["all", "pk", "fk"], default="all")
-    p.add_argument("-f", "--format", choices=["text", "json"], default="text")
+
+def _add_constraints_parser(subparsers):
+    p = subparsers.add_parser("constraints", help=_h("List constraints"))
+    p.add_argument("schema", nargs="?", default=None, help=_h(SCHEMA_HELP))
+    p.add_argument("-t", "--type", choices=_CONSTRAINT_TYPES, default="all")
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON, default="text")
     p.set_defaults(func=cmd_constraints)
 
-    # stats command
-    p = subparsers.add_parser("stats", help="Show schema statistics")
-    p.add_argument("schema", nargs="?", default=None, help=SCHEMA_HELP)
-    p.add_argument("-f", "--format", choices=["text", "json"], default="text")
+
+def _add_stats_parser(subparsers):
+    p = subparsers.add_parser("stats", help=_h("Show schema statistics"))
+    p.add_argument("schema", nargs="?", default=None, help=_h(SCHEMA_HELP))
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON, default="text")
     p.set_defaults(func=cmd_stats)
 
-    # config command
-    p = subparsers.add_parser("config", help="Manage configuration (set default schema)")
+
+def _add_config_parser(subparsers):
+    p = subparsers.add_parser("config", help=_h("Manage configuration (set default schema)"))
     p.add_argument(
         "action",
-        choices=["show", "set-default", "clear"],
-        help="show: display config, set-default: set default schema, clear: remove default"
+        choices=_CONFIG_ACTIONS,
+        help=_h("show: display config, set-default: set default schema, clear: remove default")
     )
-    p.add_argument("schema", nargs="?", help="Schema specifier for set-default (e.g., eppm:24.12)")
-    p.add_argument("-f", "--format", choices=["text", "json"], default="text")
+    p.add_argument("schema", nargs="?", help=_h("Schema specifier for set-default (e.g., eppm:24.12)"))
+    p.add_argument("-f", "--format", choices=_FMT_TEXT_JSON, default="text")
     p.set_defaults(func=cmd_config)
 
+
+# Maps every accepted command word (aliases included) to its builder, in
+# the order commands should appear in --help output.
+_SUBCOMMAND_BUILDERS = {
+    "list": _add_list_parser,
+    "info": _add_info_parser,
+    "tables": _add_tables_parser,
+    "describe": _add_describe_parser,
+    "relationships": _add_relationships_parser,
+    "rels": _add_relationships_parser,
+    "search": _add_search_parser,
+    "compare": _add_compare_parser,
+    "export": _add_export_parser,
+    "fields": _add_fields_parser,
+    "constraints": _add_constraints_parser,
+    "stats": _add_stats_parser,
+    "config": _add_config_parser,
+}
+
+
+def main():
+    global _HELP_WANTED
+    _HELP_WANTED = len(sys.argv) < 2 or "-h" in sys.argv or "--help" in sys.argv
+
+    parser = argparse.ArgumentParser(
+        prog="p6schema",
+        description=_h(
+            "Parse and analyze Oracle P6 EPPM schema files. "
+            "Use 'p6schema list' to see available schemas. "
+            "If no schema is specified, the latest EPPM version is used."
+        ),
+        epilog=_h("Schema can be specified as a file path or registry key (e.g., eppm:24.12)"),
+    )
+    parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
+
+    subparsers = parser.add_subparsers(dest="command", help=_h("Available commands"))
+
+    builder = _SUBCOMMAND_BUILDERS.get(sys.argv[1]) if len(sys.argv) > 1 else None
+    if builder is not None:
+        builder(subparsers)
+    else:
+        # Help, no command, or an unknown word: register everything so
+        # argparse can list the full command set (dedupe alias entries).
+        added = set()
+        for b in _SUBCOMMAND_BUILDERS.values():
+            if b not in added:
+                added.add(b)
+                b(subparsers)
+
     args = parser.parse_args()
 
     if not args.command:
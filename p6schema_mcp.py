@@ -6,31 +6,85 @@ Run with: fastmcp run p6schema_mcp.py
 Or: python p6schema_mcp.py
 """
 
-from dataclasses import asdict
 from typing import Optional
 
-from fastmcp import FastMCP
-
-from p6schema import (
-    Schema,
-    get_registry,
-    resolve_schema_path,
-    load_config,
-    save_config,
-    get_default_schema,
-    CONFIG_FILE,
-)
-
-mcp = FastMCP("P6 Schema Parser")
+# p6schema (and everything it imports - argparse, the registry scan, the
+# XML parser binding) is deferred to first tool use so importing this
+# module only pays for fastmcp.
+_p6schema = None
+
+
+def _p6():
+    """Return the p6schema module, importing it on first use."""
+    global _p6schema
+    if _p6schema is None:
+        import p6schema
+        _p6schema = p6schema
+    return _p6schema
+
+
+# Names re-exported from p6schema, resolved lazily (PEP 562) so
+# `from p6schema_mcp import Schema` keeps working for importers.
+_P6_EXPORTS = frozenset({
+    "Schema",
+    "get_registry",
+    "resolve_schema_path",
+    "load_config",
+    "save_config",
+    "get_default_schema",
+    "CONFIG_FILE",
+})
+
+
+def __getattr__(name):
+    if name == "mcp":
+        # `fastmcp run p6schema_mcp.py` resolves this attribute; the
+        # server is built and the tools registered on first access.
+        return _register()
+    if name in _P6_EXPORTS:
+        return getattr(_p6(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# FastMCP server, created lazily: importing this module as a library
+# (for the re-exports above, or for introspection) skips the fastmcp
+# import and the per-tool schema reflection entirely.
+_mcp = None
+
+
+def _register():
+    """Create the FastMCP server and register all tools, once."""
+    global _mcp
+    if _mcp is None:
+        from fastmcp import FastMCP
+        server = FastMCP("P6 Schema Parser")
+        for fn in _TOOLS:
+            server.tool(fn)
+        _mcp = server
+    return _mcp
+
+
+def _load_schema(spec: Optional[str]):
+    """Load a schema for a tool call.
+
+    Repeat calls hit p6schema's process-level parse cache, which keys on
+    resolved path + mtime + size, so a long-lived server re-parses only
+    when the file on disk actually changes. None is normalized to the
+    configured default first so explicit and default callers share one
+    cache entry.
+    """
+    p6 = _p6()
+    if spec is None:
+        spec = p6.get_default_schema()
+    return p6.Schema.from_xml(spec)
 
 
-@mcp.tool
 def list_schemas() -> list[dict]:
     """List all available P6 schemas in the registry.
 
     Returns a list of schemas with their keys, applications, versions, and paths.
     """
-    registry = get_registry()
+    registry = _p6().get_registry()
     entries = registry.list_all()
 
     return [
@@ -44,7 +98,6 @@ def list_schemas() -> list[dict]:
     ]
 
 
-@mcp.tool
 def get_schema_info(schema: Optional[str] = None) -> dict:
     """Get metadata information about a schema.
 
@@ -54,7 +107,7 @@ def get_schema_info(schema: Optional[str] = None) -> dict:
     Returns:
         Schema metadata including version, DB type, build version, and table count.
     """
-    s = Schema.from_xml(schema)
+    s = _load_schema(schema)
     return {
         "version": s.version,
         "dbtype": s.dbtype,
@@ -65,7 +118,6 @@ def get_schema_info(schema: Optional[str] = None) -> dict:
     }
 
 
-@mcp.tool
 def list_tables(schema: Optional[str] = None) -> list[dict]:
     """List all tables in a schema.
 
@@ -75,8 +127,7 @@ def list_tables(schema: Optional[str] = None) -> list[dict]:
     Returns:
         List of tables with name, description, and field count.
     """
-    s = Schema.from_xml(schema)
-    tables = sorted(s.tables.values(), key=lambda t: t.name)
+    s = _load_schema(schema)
 
     return [
         {
@@ -84,11 +135,10 @@ def list_tables(schema: Optional[str] = None) -> list[dict]:
             "description": t.description,
             "field_count": len(t.fields),
         }
-        for t in tables
+        for t in s.tables_sorted
     ]
 
 
-@mcp.tool
 def describe_table(table: str, schema: Optional[str] = None) -> dict:
     """Get detailed information about a specific table.
 
@@ -99,7 +149,7 @@ def describe_table(table: str, schema: Optional[str] = None) -> dict:
     Returns:
         Table details including fields, indexes, constraints, and triggers.
     """
-    s = Schema.from_xml(schema)
+    s = _load_schema(schema)
     t = s.get_table(table)
 
     if not t:
@@ -110,14 +160,13 @@ def describe_table(table: str, schema: Optional[str] = None) -> dict:
         "description": t.description,
         "title": t.title,
         "tablespace": t.tablespace,
-        "fields": [asdict(f) for f in t.fields],
-        "indexes": [asdict(i) for i in t.indexes],
-        "constraints": [asdict(c) for c in t.constraints],
-        "triggers": [asdict(tr) for tr in t.triggers],
+        "fields": [f.to_dict() for f in t.fields],
+        "indexes": [i.to_dict() for i in t.indexes],
+        "constraints": [c.to_dict() for c in t.constraints],
+        "triggers": [tr.to_dict() for tr in t.triggers],
     }
 
 
-@mcp.tool
 def get_relationships(table: str, schema: Optional[str] = None) -> dict:
     """Get foreign key relationships for a table.
 
@@ -129,7 +178,7 @@ def get_relationships(table: str, schema: Optional[str] = None) -> dict:
         Outgoing references (tables this table references) and
         incoming references (tables that reference this table).
     """
-    s = Schema.from_xml(schema)
+    s = _load_schema(schema)
     t = s.get_table(table)
 
     if not t:
@@ -137,28 +186,26 @@ def get_relationships(table: str, schema: Optional[str] = None) -> dict:
 
     # Outgoing: tables this table references
     outgoing = []
-    for c in t.constraints:
-        if c.type == "FOREIGN":
-            outgoing.append({
-                "constraint": c.name,
-                "fields": c.fields,
-                "references_table": c.target_table,
-                "references_fields": c.target_fields,
-            })
-
-    # Incoming: tables that reference this table
+    for c in t.constraints_by_type.get("FOREIGN", ()):
+        outgoing.append({
+            "constraint": c.name,
+            "fields": c.fields,
+            "references_table": c.target_table,
+            "references_fields": c.target_fields,
+        })
+
+    # Incoming: tables that reference this table, via the reverse FK
+    # index built once per Schema instead of scanning every constraint.
     incoming = []
-    for other_table in s.tables.values():
-        if other_table.name == t.name:
+    for source_name, c in s._incoming_fks.get(t.name.upper(), []):
+        if source_name == t.name:
             continue
-        for c in other_table.constraints:
-            if c.type == "FOREIGN" and c.target_table.upper() == t.name.upper():
-                incoming.append({
-                    "table": other_table.name,
-                    "constraint": c.name,
-                    "fields": c.fields,
-                    "references_fields": c.target_fields,
-                })
+        incoming.append({
+            "table": source_name,
+            "constraint": c.name,
+            "fields": c.fields,
+            "references_fields": c.target_fields,
+        })
 
     return {
         "table": t.name,
@@ -169,7 +216,44 @@ def get_relationships(table: str, schema: Optional[str] = None) -> dict:
     }
 
 
-@mcp.tool
+def _search_tables(s, pattern: str) -> list[dict]:
+    return [
+        {"name": t.name, "description": t.description}
+        for t in s.search_tables(pattern)
+    ]
+
+
+def _search_fields(s, pattern: str) -> list[dict]:
+    return [
+        {
+            "table": table_name,
+            "field": f.name,
+            "datatype": f.datatype,
+            "description": f.description,
+        }
+        for table_name, f in s.search_fields(pattern)
+    ]
+
+
+def _search_relationships(s, pattern: str) -> list[dict]:
+    return s.search_relationships(pattern)
+
+
+# search_type -> result sections to build, replacing a cascade of
+# overlapping membership tests in the search tool.
+_SEARCH_DISPATCH = {
+    "table": (("tables", _search_tables),),
+    "field": (("fields", _search_fields),),
+    "rel": (("relationships", _search_relationships),),
+    "relationship": (("relationships", _search_relationships),),
+    "all": (
+        ("tables", _search_tables),
+        ("fields", _search_fields),
+        ("relationships", _search_relationships),
+    ),
+}
+
+
 def search(
     pattern: str,
     search_type: str = "all",
@@ -185,36 +269,14 @@ def search(
     Returns:
         Matching tables, fields, and/or relationships based on search_type.
     """
-    s = Schema.from_xml(schema)
-    result = {}
-
-    if search_type in ("table", "all"):
-        tables = s.search_tables(pattern)
-        result["tables"] = [
-            {"name": t.name, "description": t.description}
-            for t in tables
-        ]
-
-    if search_type in ("field", "all"):
-        fields = s.search_fields(pattern)
-        result["fields"] = [
-            {
-                "table": table_name,
-                "field": f.name,
-                "datatype": f.datatype,
-                "description": f.description,
-            }
-            for table_name, f in fields
-        ]
+    sections = _SEARCH_DISPATCH.get(search_type)
+    if sections is None:
+        return {"error": f"Unknown search_type '{search_type}'"}
 
-    if search_type in ("rel", "relationship", "all"):
-        rels = s.search_relationships(pattern)
-        result["relationships"] = rels
+    s = _load_schema(schema)
+    return {key: build(s, pattern) for key, build in sections}
 
-    return result
 
-
-@mcp.tool
 def compare_schemas(schema1: str, schema2: str) -> dict:
     """Compare two schema versions to find differences.
 
@@ -225,11 +287,11 @@ def compare_schemas(schema1: str, schema2: str) -> dict:
     Returns:
         Added tables, removed tables, and tables with field changes.
     """
-    s1 = Schema.from_xml(schema1)
-    s2 = Schema.from_xml(schema2)
+    s1 = _load_schema(schema1)
+    s2 = _load_schema(schema2)
 
-    tables1 = set(s1.tables.keys())
-    tables2 = set(s2.tables.keys())
+    tables1 = s1.tables.keys()
+    tables2 = s2.tables.keys()
 
     added = tables2 - tables1
     removed = tables1 - tables2
@@ -239,13 +301,15 @@ def compare_schemas(schema1: str, schema2: str) -> dict:
     for name in common:
         t1 = s1.tables[name]
         t2 = s2.tables[name]
-        f1 = {f.name for f in t1.fields}
-        f2 = {f.name for f in t2.fields}
+        f1 = t1.field_names_set
+        f2 = t2.field_names_set
         if f1 != f2:
+            # Ordered-tuple scan against the other side's name set:
+            # changes come out in schema-definition order, no sort.
             modified.append({
                 "table": name,
-                "added_fields": sorted(f2 - f1),
-                "removed_fields": sorted(f1 - f2),
+                "added_fields": [n for n in t2.field_names_ordered if n not in f1],
+                "removed_fields": [n for n in t1.field_names_ordered if n not in f2],
             })
 
     return {
@@ -257,7 +321,6 @@ def compare_schemas(schema1: str, schema2: str) -> dict:
     }
 
 
-@mcp.tool
 def get_fields(table: Optional[str] = None, schema: Optional[str] = None) -> list[dict]:
     """List fields, optionally filtered by table.
 
@@ -268,7 +331,7 @@ def get_fields(table: Optional[str] = None, schema: Optional[str] = None) -> lis
     Returns:
         List of fields with table, name, datatype, length, and description.
     """
-    s = Schema.from_xml(schema)
+    s = _load_schema(schema)
 
     if table:
         t = s.get_table(table)
@@ -276,24 +339,22 @@ def get_fields(table: Optional[str] = None, schema: Optional[str] = None) -> lis
             return [{"error": f"Table '{table}' not found"}]
         tables = [t]
     else:
-        tables = sorted(s.tables.values(), key=lambda t: t.name)
-
-    result = []
-    for t in tables:
-        for f in t.fields:
-            result.append({
-                "table": t.name,
-                "field": f.name,
-                "datatype": f.datatype,
-                "length": f.charlength or f.dataprecision or "",
-                "notnull": f.notnull == "Y",
-                "description": f.description,
-            })
+        tables = s.tables_sorted
 
-    return result
+    return [
+        {
+            "table": t.name,
+            "field": f.name,
+            "datatype": f.datatype,
+            "length": f.charlength or f.dataprecision or "",
+            "notnull": f.notnull == "Y",
+            "description": f.description,
+        }
+        for t in tables
+        for f in t.fields
+    ]
 
 
-@mcp.tool
 def get_constraints(
     constraint_type: str = "all",
     schema: Optional[str] = None,
@@ -307,32 +368,34 @@ def get_constraints(
     Returns:
         List of constraints with table, name, type, fields, and target info.
     """
-    s = Schema.from_xml(schema)
+    s = _load_schema(schema)
 
+    # Filtered queries read the schema-level per-type bucket directly,
+    # so their cost scales with the result instead of every constraint.
     if constraint_type == "fk":
-        filter_type = "FOREIGN"
+        pairs = s.constraints_by_type.get("FOREIGN", [])
     elif constraint_type == "pk":
-        filter_type = "PRIMARY"
+        pairs = s.constraints_by_type.get("PRIMARY", [])
     else:
-        filter_type = None
-
-    result = []
-    for table in s.tables.values():
-        for c in table.constraints:
-            if filter_type is None or c.type == filter_type:
-                result.append({
-                    "table": table.name,
-                    "name": c.name,
-                    "type": c.type,
-                    "fields": c.fields,
-                    "target_table": c.target_table,
-                    "target_fields": c.target_fields,
-                })
+        pairs = (
+            (table.name, c)
+            for table in s.tables.values()
+            for c in table.constraints
+        )
 
-    return result
+    return [
+        {
+            "table": table_name,
+            "name": c.name,
+            "type": c.type,
+            "fields": c.fields,
+            "target_table": c.target_table,
+            "target_fields": c.target_fields,
+        }
+        for table_name, c in pairs
+    ]
 
 
-@mcp.tool
 def get_stats(schema: Optional[str] = None) -> dict:
     """Get schema statistics.
 
@@ -343,48 +406,25 @@ def get_stats(schema: Optional[str] = None) -> dict:
         Statistics including table count, field count, indexes, constraints,
         foreign keys, and datatype distribution.
     """
-    s = Schema.from_xml(schema)
-
-    total_fields = sum(len(t.fields) for t in s.tables.values())
-    total_indexes = sum(len(t.indexes) for t in s.tables.values())
-    total_constraints = sum(len(t.constraints) for t in s.tables.values())
-    total_fks = sum(
-        1 for t in s.tables.values()
-        for c in t.constraints if c.type == "FOREIGN"
-    )
-
-    datatypes = {}
-    for t in s.tables.values():
-        for f in t.fields:
-            datatypes[f.datatype] = datatypes.get(f.datatype, 0) + 1
+    # Computed once and cached on the Schema, so repeat calls against a
+    # cached schema return immediately.
+    return _load_schema(schema).stats
 
-    return {
-        "version": s.version,
-        "tables": len(s.tables),
-        "fields": total_fields,
-        "indexes": total_indexes,
-        "constraints": total_constraints,
-        "foreign_keys": total_fks,
-        "datatypes": datatypes,
-    }
 
-
-@mcp.tool
 def config_show() -> dict:
     """Show current configuration.
 
     Returns:
         Current configuration including default schema and config file path.
     """
-    config = load_config()
+    config = _p6().load_config()
     return {
-        "config_file": str(CONFIG_FILE),
+        "config_file": str(_p6().CONFIG_FILE),
         "default_schema": config.get("default_schema"),
         "config": config,
     }
 
 
-@mcp.tool
 def config_set_default(schema: str) -> dict:
     """Set the default schema.
 
@@ -394,19 +434,24 @@ def config_set_default(schema: str) -> dict:
     Returns:
         Confirmation message with the new default schema.
     """
-    registry = get_registry()
+    registry = _p6().get_registry()
     entry = registry.get(schema)
 
     if not entry:
-        available = registry.available_keys
+        prefix = schema.split(":", 1)[0].lower() if ":" in schema else None
+        if prefix is not None and prefix not in registry.known_prefixes:
+            return {
+                "error": f"Unknown application prefix '{prefix}'",
+                "known_prefixes": sorted(registry.known_prefixes),
+            }
         return {
             "error": f"Schema '{schema}' not found",
-            "available": available,
+            "available": registry.available_keys,
         }
 
-    config = load_config()
+    config = _p6().load_config()
     config["default_schema"] = schema
-    save_config(config)
+    _p6().save_config(config)
 
     return {
         "success": True,
@@ -415,21 +460,20 @@ def config_set_default(schema: str) -> dict:
     }
 
 
-@mcp.tool
 def config_clear_default() -> dict:
     """Clear the default schema setting.
 
     Returns:
         Confirmation message.
     """
-    config = load_config()
+    config = _p6().load_config()
 
     if "default_schema" in config:
         del config["default_schema"]
         if config:
-            save_config(config)
+            _p6().save_config(config)
         else:
-            CONFIG_FILE.unlink(missing_ok=True)
+            _p6().CONFIG_FILE.unlink(missing_ok=True)
         return {
             "success": True,
             "message": "Default schema cleared. Will use latest EPPM.",
@@ -441,5 +485,23 @@ def config_clear_default() -> dict:
     }
 
 
+# Registered with the server in this order on first access of `mcp`.
+_TOOLS = (
+    list_schemas,
+    get_schema_info,
+    list_tables,
+    describe_table,
+    get_relationships,
+    search,
+    compare_schemas,
+    get_fields,
+    get_constraints,
+    get_stats,
+    config_show,
+    config_set_default,
+    config_clear_default,
+)
+
+
 if __name__ == "__main__":
-    mcp.run()
+    _register().run()